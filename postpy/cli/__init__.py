@@ -2,6 +2,7 @@
 CLI module.
 """
 from .mock import mock_group
+from .bench import bench_group
 import click
 
 @click.group()
@@ -10,5 +11,6 @@ def cli():
     pass
 
 cli.add_command(mock_group, name='mock')
+cli.add_command(bench_group, name='bench')
 
-__all__ = ['cli', 'mock_group'] 
\ No newline at end of file
+__all__ = ['cli', 'mock_group', 'bench_group'] 
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+Benchmark CLI commands.
+"""
+import click
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from ..core.bench import BenchRunner, compare_runs
+from ..core.executor import RequestExecutor
+from ..core.loader import CollectionLoader
+
+console = Console()
+
+@click.group()
+def bench_group():
+    """Benchmark - Record and Compare API Latency
+
+    Record per-request latency distributions for a collection and compare
+    them against a stored baseline run to catch API slowdowns.
+
+    Available commands:
+    """
+    pass
+
+@bench_group.command()
+@click.argument('collection_file', type=click.Path(exists=True))
+@click.option('--output', '-o', required=True, type=click.Path(), help='Path to save the run to')
+@click.option('--iterations', '-n', default=20, show_default=True, type=click.IntRange(min=1),
+              help='Timed executions per request')
+@click.option('--warmup', default=1, show_default=True, type=click.IntRange(min=0),
+              help='Untimed executions per request before measuring')
+@click.option('--timeout', default=30.0, show_default=True,
+              type=click.FloatRange(min=0, min_open=True),
+              help='Seconds to wait for each call before counting it as failed')
+@click.option('--env-file', '-e', help='Path to environment file')
+@click.option('--request-name', '-r', help='Benchmark specific request by name')
+@click.option('--mock-config', type=click.Path(exists=True),
+              help='Run against a local mock server started from this config instead of base_url')
+def run(collection_file, output, iterations, warmup, timeout, env_file, request_name, mock_config):
+    """Benchmark a collection and save the timings.
+
+    COLLECTION_FILE: Path to the collection whose requests are benchmarked
+    """
+    server = None
+    try:
+        collection = CollectionLoader.load_collection(collection_file)
+
+        env_vars = {}
+        if env_file:
+            env_vars = CollectionLoader.load_environment(env_file).variables
+
+        base_url = str(collection.base_url)
+        if mock_config:
+            from ..core.mock_server import MockServer
+            server = MockServer(mock_config)
+            base_url = server.start_background()
+
+        runner = BenchRunner(RequestExecutor(base_url, env_vars, timeout=timeout))
+        bench_run = runner.run(collection, iterations=iterations, warmup=warmup,
+                               request_name=request_name)
+        BenchRunner.save_run(bench_run, output)
+
+        failed = sum(bench_run.failures.values())
+        console.print(Panel.fit(
+            f"[bold green]Benchmark Complete[/bold green]\n"
+            f"Collection: {bench_run.collection_name}\n"
+            f"Target: {bench_run.base_url}\n"
+            f"Requests: {len(bench_run.samples)} x {iterations} iterations\n"
+            f"Failed calls: {failed}\n"
+            f"Saved to: {output}",
+            title="Benchmark"
+        ))
+        for name, count in bench_run.failures.items():
+            if count:
+                console.print(f"[yellow]Warning:[/yellow] {name}: {count}/{iterations} calls failed "
+                              f"and were excluded from the samples")
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        raise click.Abort()
+    finally:
+        if server is not None:
+            server.stop()
+
+@bench_group.command()
+@click.argument('baseline_file', type=click.Path())
+@click.argument('current_file', type=click.Path())
+@click.option('--threshold', '-t', default=0.1, show_default=True, type=click.FloatRange(min=0),
+              help='Allowed relative p50/p95 increase, e.g. 0.1 for 10%')
+@click.option('--alpha', default=0.05, show_default=True,
+              type=click.FloatRange(0, 1, min_open=True, max_open=True),
+              help='Significance level for the Mann-Whitney U test')
+@click.pass_context
+def compare(ctx, baseline_file, current_file, threshold, alpha):
+    """Compare a run against a baseline run.
+
+    Exits with status 1 if any request regressed or has no successful
+    samples in the current run, and with status 2 if the runs cannot be
+    loaded or compared.
+
+    BASELINE_FILE: Path to the stored baseline run
+    CURRENT_FILE: Path to the new run
+    """
+    try:
+        baseline = BenchRunner.load_run(baseline_file)
+        current = BenchRunner.load_run(current_file)
+        results = compare_runs(baseline, current, threshold=threshold, alpha=alpha)
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        ctx.exit(2)
+
+    table = Table(title=f"Benchmark Comparison ({baseline.collection_name})")
+    table.add_column("Request", style="cyan")
+    table.add_column("p50", style="green")
+    table.add_column("Δ p50", justify="right")
+    table.add_column("p95", style="green")
+    table.add_column("Δ p95", justify="right")
+    table.add_column("p-value", justify="right", style="magenta")
+    table.add_column("Status")
+
+    status_colors = {"ok": "green", "regressed": "red", "new": "yellow", "missing": "red"}
+    for result in results:
+        color = status_colors[result.status]
+        table.add_row(
+            result.name,
+            f"{_ms(result.baseline_p50)} → {_ms(result.current_p50)}",
+            _pct(result.p50_change),
+            f"{_ms(result.baseline_p95)} → {_ms(result.current_p95)}",
+            _pct(result.p95_change),
+            f"{result.p_value:.4f}" if result.p_value is not None else "-",
+            f"[{color}]{result.status}[/{color}]"
+        )
+
+    console.print(table)
+
+    regressions = [r for r in results if r.regressed]
+    missing = [r for r in results if r.status == "missing"]
+    if regressions:
+        console.print(f"[bold red]{len(regressions)} request(s) regressed:[/bold red] "
+                      f"{', '.join(r.name for r in regressions)}")
+    if missing:
+        console.print(f"[bold red]{len(missing)} request(s) missing from the current run:[/bold red] "
+                      f"{', '.join(r.name for r in missing)}")
+    if regressions or missing:
+        ctx.exit(1)
+    console.print("[bold green]No regressions detected[/bold green]")
+
+def _ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.1f}ms"
+
+def _pct(change):
+    return "-" if change is None else f"{change:+.1%}"
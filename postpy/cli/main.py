@@ -9,6 +9,7 @@ from rich.syntax import Syntax
 import json
 from datetime import datetime
 from .mock import mock_group
+from .bench import bench_group
 
 from ..core.loader import CollectionLoader
 from ..core.executor import RequestExecutor
@@ -31,6 +32,7 @@ def cli():
     pass
 
 cli.add_command(mock_group, name='mock')
+cli.add_command(bench_group, name='bench')
 
 @cli.command()
 @click.argument('collection_file')
@@ -1,6 +1,7 @@
 from .models import Request, Collection, Environment, RequestHistory, TestAssertion
 from .executor import RequestExecutor
 from .loader import CollectionLoader
+from .bench import BenchRun, BenchRunner, RequestComparison, compare_runs
 
 __all__ = [
     'Request',
@@ -9,5 +10,9 @@ __all__ = [
     'RequestHistory',
     'TestAssertion',
     'RequestExecutor',
-    'CollectionLoader'
+    'CollectionLoader',
+    'BenchRun',
+    'BenchRunner',
+    'RequestComparison',
+    'compare_runs'
 ] 
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Benchmark runs and baseline comparison.
+"""
+import json
+import math
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+import requests
+from pydantic import BaseModel, Field
+
+from .models import Collection, Request, RequestHistory
+from .executor import RequestExecutor
+
+class BenchRun(BaseModel):
+    collection_name: str
+    base_url: str
+    timestamp: str
+    iterations: int
+    samples: Dict[str, List[RequestHistory]] = Field(default_factory=dict)
+    failures: Dict[str, int] = Field(default_factory=dict)
+
+    def latencies(self, name: str) -> List[float]:
+        """Return the recorded response times for a request, in seconds."""
+        return [entry.response_time for entry in self.samples.get(name, [])]
+
+class RequestComparison(BaseModel):
+    name: str
+    baseline_p50: Optional[float] = None
+    baseline_p95: Optional[float] = None
+    current_p50: Optional[float] = None
+    current_p95: Optional[float] = None
+    p50_change: Optional[float] = None
+    p95_change: Optional[float] = None
+    p_value: Optional[float] = None
+    status: str
+
+    @property
+    def regressed(self) -> bool:
+        return self.status == "regressed"
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the pct-th percentile (0-100) using linear interpolation."""
+    if not values:
+        raise ValueError("Cannot compute a percentile of no values")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+def mann_whitney_u(baseline: List[float], current: List[float]) -> float:
+    """One-sided Mann-Whitney U test that current is slower than baseline.
+
+    Uses the normal approximation with tie and continuity correction and
+    returns the p-value.
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Both samples must be non-empty")
+
+    combined = sorted(
+        [(value, 0) for value in baseline] + [(value, 1) for value in current]
+    )
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        avg_rank = (i + j) / 2.0 + 1
+        for k in range(i, j + 1):
+            ranks[k] = avg_rank
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2.0
+    mean_u = n1 * n2 / 2.0
+    n = n1 + n2
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean_u - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+class BenchRunner:
+    def __init__(self, executor: RequestExecutor):
+        self.executor = executor
+
+    def run(self, collection: Collection, iterations: int = 20, warmup: int = 1,
+            request_name: Optional[str] = None) -> BenchRun:
+        """Execute each request repeatedly and collect its timing history.
+
+        Timed calls that fail, including connection errors and timeouts, are
+        counted in failures instead of aborting the run. Warmup results are
+        discarded either way.
+        """
+        if iterations < 1:
+            raise ValueError("iterations must be at least 1")
+
+        selected = [r for r in collection.requests if not request_name or r.name == request_name]
+        if not selected:
+            raise ValueError(f"No requests found{' matching ' + request_name if request_name else ''}")
+
+        names = [r.name for r in selected]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate request names cannot be benchmarked: {', '.join(duplicates)}")
+
+        samples: Dict[str, List[RequestHistory]] = {}
+        failures: Dict[str, int] = {}
+        for req in selected:
+            for _ in range(warmup):
+                try:
+                    self.executor.execute(req)
+                except requests.RequestException:
+                    pass
+            samples[req.name] = []
+            failures[req.name] = 0
+            for _ in range(iterations):
+                try:
+                    response = self.executor.execute(req)
+                except requests.RequestException:
+                    failures[req.name] += 1
+                    continue
+                if self._succeeded(req, response):
+                    samples[req.name].append(self.executor.history[-1])
+                else:
+                    failures[req.name] += 1
+
+        return BenchRun(
+            collection_name=collection.collection_name,
+            base_url=self.executor.base_url,
+            timestamp=datetime.now().isoformat(),
+            iterations=iterations,
+            samples=samples,
+            failures=failures
+        )
+
+    def _succeeded(self, request: Request, response: requests.Response) -> bool:
+        """Return whether a response counts as a valid latency sample.
+
+        Responses with a 4xx/5xx status, or that fail the request's test
+        assertions, are excluded so fast errors cannot mask a slowdown. A
+        status_code assertion replaces the 4xx/5xx check.
+        """
+        tests = request.tests
+        if (tests is None or tests.status_code is None) and response.status_code >= 400:
+            return False
+        if tests is not None:
+            return all(self.executor.run_tests(response, tests).values())
+        return True
+
+    @staticmethod
+    def save_run(run: BenchRun, file_path: str) -> None:
+        """Persist a benchmark run as JSON."""
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(run.model_dump_json(indent=2))
+
+    @staticmethod
+    def load_run(file_path: str) -> BenchRun:
+        """Load a benchmark run from a JSON file."""
+        with open(file_path, 'r') as f:
+            return BenchRun(**json.load(f))
+
+def compare_runs(baseline: BenchRun, current: BenchRun, threshold: float = 0.1,
+                 alpha: float = 0.05) -> List[RequestComparison]:
+    """Compare per-request latency distributions of two runs.
+
+    A request is flagged as regressed when the Mann-Whitney U test finds the
+    current latencies significantly slower (p < alpha) and its p50 or p95 grew
+    by more than threshold (a fraction, 0.1 meaning 10%). A request with no
+    successful samples in the current run is reported as missing.
+    """
+    results = []
+    names = list(baseline.samples) + [n for n in current.samples if n not in baseline.samples]
+    for name in names:
+        base = baseline.latencies(name)
+        cur = current.latencies(name)
+        if not base or not cur:
+            results.append(RequestComparison(
+                name=name,
+                baseline_p50=percentile(base, 50) if base else None,
+                baseline_p95=percentile(base, 95) if base else None,
+                current_p50=percentile(cur, 50) if cur else None,
+                current_p95=percentile(cur, 95) if cur else None,
+                status="missing" if not cur else "new"
+            ))
+            continue
+
+        base_p50, base_p95 = percentile(base, 50), percentile(base, 95)
+        cur_p50, cur_p95 = percentile(cur, 50), percentile(cur, 95)
+        p50_change = _relative_change(base_p50, cur_p50)
+        p95_change = _relative_change(base_p95, cur_p95)
+        p_value = mann_whitney_u(base, cur)
+
+        if p_value < alpha and (p50_change > threshold or p95_change > threshold):
+            status = "regressed"
+        else:
+            status = "ok"
+
+        results.append(RequestComparison(
+            name=name,
+            baseline_p50=base_p50,
+            baseline_p95=base_p95,
+            current_p50=cur_p50,
+            current_p95=cur_p95,
+            p50_change=p50_change,
+            p95_change=p95_change,
+            p_value=p_value,
+            status=status
+        ))
+    return results
+
+def _relative_change(before: float, after: float) -> float:
+    if before == 0:
+        return 0.0 if after == 0 else math.inf
+    return (after - before) / before
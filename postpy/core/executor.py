@@ -1,15 +1,17 @@
 import json
 import time
-from typing import Dict, Optional, Union, Any
+from typing import Dict, List, Optional, Union, Any
 import requests
 from datetime import datetime
 
 from .models import Request, RequestHistory, TestAssertion
 
 class RequestExecutor:
-    def __init__(self, base_url: str, environment_vars: Optional[Dict[str, str]] = None):
+    def __init__(self, base_url: str, environment_vars: Optional[Dict[str, str]] = None,
+                 timeout: Optional[float] = None):
         self.base_url = base_url.rstrip('/')
         self.environment_vars = environment_vars or {}
+        self.timeout = timeout
         self.history: List[RequestHistory] = []
 
     def _substitute_variables(self, value: str) -> str:
@@ -50,19 +52,21 @@ class RequestExecutor:
         params = self._prepare_query_params(request.query_params)
         body = self._prepare_body(request.body)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = requests.request(
             method=request.method,
             url=url,
             headers=headers,
             params=params,
             json=body if isinstance(body, dict) else None,
-            data=body if isinstance(body, str) else None
+            data=body if isinstance(body, str) else None,
+            timeout=self.timeout
         )
-        response_time = time.time() - start_time
+        response_time = time.perf_counter() - start_time
 
         # Record request history
         history_entry = RequestHistory(
+            name=request.name,
             method=request.method,
             endpoint=request.endpoint,
             timestamp=datetime.now().isoformat(),
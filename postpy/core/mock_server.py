@@ -17,6 +17,8 @@ class MockServer:
         """
         self.app = Flask(__name__)
         self.config = self._load_config(config_path)
+        self._server = None
+        self._thread = None
         self._setup_routes()
     
     def _load_config(self, config_path):
@@ -95,7 +97,45 @@ class MockServer:
             debug (bool): Whether to run in debug mode
         """
         self.app.run(host=host, port=port, debug=debug)
-    
+
+    def start_background(self, host='127.0.0.1', port=0):
+        """Serve the mock API from a background thread.
+
+        Args:
+            host (str): Host to bind the server to
+            port (int): Port to bind to, 0 picks a free port
+
+        Returns:
+            str: Base URL the server is reachable at
+
+        Raises:
+            RuntimeError: If a background server is already running
+        """
+        if self._server is not None:
+            raise RuntimeError("Mock server is already running in the background")
+
+        import threading
+        from werkzeug.serving import make_server, WSGIRequestHandler
+
+        class QuietRequestHandler(WSGIRequestHandler):
+            def log_request(self, *args, **kwargs):
+                pass
+
+        self._server = make_server(host, port, self.app, threaded=True,
+                                   request_handler=QuietRequestHandler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return f"http://{host}:{self._server.server_port}"
+
+    def stop(self):
+        """Stop a server started with start_background."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
     @classmethod
     def create_config(cls, output_path):
         """Create a default configuration file.
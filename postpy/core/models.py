@@ -24,6 +24,7 @@ class Environment(BaseModel):
     variables: Dict[str, str] = Field(default_factory=dict)
 
 class RequestHistory(BaseModel):
+    name: Optional[str] = None
     method: str
     endpoint: str
     timestamp: str
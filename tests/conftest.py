@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from postpy.core.mock_server import MockServer
+
+@pytest.fixture
+def mock_config(tmp_path):
+    path = tmp_path / "mock.yaml"
+    MockServer.create_config(str(path))
+    return str(path)
+
+@pytest.fixture
+def server(mock_config):
+    server = MockServer(mock_config)
+    yield server
+    server.stop()
+
+@pytest.fixture
+def make_collection(tmp_path):
+    def make(requests, file_name="collection.json"):
+        path = tmp_path / file_name
+        path.write_text(json.dumps({
+            "collection_name": "Mock",
+            "base_url": "http://example.invalid",
+            "requests": requests
+        }))
+        return str(path)
+    return make
+
+@pytest.fixture
+def collection_file(make_collection):
+    return make_collection([
+        {"name": "Health", "method": "GET", "endpoint": "/api/v1/health"},
+        {"name": "Users", "method": "GET", "endpoint": "/api/v1/users"}
+    ])
@@ -0,0 +1,291 @@
+import json
+import math
+import socket
+
+import pytest
+from click.testing import CliRunner
+
+from postpy.cli import cli
+from postpy.core.bench import BenchRun, BenchRunner, compare_runs, mann_whitney_u, percentile
+from postpy.core.executor import RequestExecutor
+from postpy.core.loader import CollectionLoader
+from postpy.core.models import RequestHistory
+
+def make_run(latencies):
+    samples = {
+        name: [
+            RequestHistory(
+                name=name,
+                method="GET",
+                endpoint=f"/{name}",
+                timestamp="2026-01-01T00:00:00",
+                status_code=200,
+                response_time=value
+            )
+            for value in values
+        ]
+        for name, values in latencies.items()
+    }
+    return BenchRun(
+        collection_name="Test",
+        base_url="http://localhost",
+        timestamp="2026-01-01T00:00:00",
+        iterations=max((len(v) for v in latencies.values()), default=0),
+        samples=samples
+    )
+
+def by_name(results):
+    return {r.name: r for r in results}
+
+class TestMannWhitneyU:
+    def test_clear_shift(self):
+        assert mann_whitney_u([1] * 5, [2] * 5) == pytest.approx(0.00199, abs=1e-5)
+
+    def test_all_ties_returns_one(self):
+        assert mann_whitney_u([1.0] * 5, [1.0] * 5) == 1.0
+
+    def test_identical_samples_are_not_significant(self):
+        values = [0.1, 0.2, 0.3, 0.4, 0.5]
+        assert mann_whitney_u(values, values) > 0.4
+
+    def test_faster_current_is_not_significant(self):
+        assert mann_whitney_u([2] * 5, [1] * 5) > 0.99
+
+    def test_empty_sample_raises(self):
+        with pytest.raises(ValueError):
+            mann_whitney_u([], [1.0])
+
+class TestPercentile:
+    def test_interpolates_between_values(self):
+        values = [4.0, 1.0, 3.0, 2.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 95) == pytest.approx(3.85)
+        assert percentile(values, 100) == 4.0
+
+    def test_single_value(self):
+        assert percentile([0.7], 95) == 0.7
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
+
+class TestCompareRuns:
+    def test_statuses(self):
+        base = [1.0 + i * 0.01 for i in range(20)]
+        baseline = make_run({"same": base, "slow": base, "gone": base})
+        current = make_run({
+            "same": base,
+            "slow": [v * 1.5 for v in base],
+            "added": base
+        })
+
+        results = by_name(compare_runs(baseline, current))
+
+        assert results["same"].status == "ok"
+        assert results["slow"].status == "regressed"
+        assert results["slow"].regressed
+        assert results["slow"].p50_change == pytest.approx(0.5)
+        assert results["gone"].status == "missing"
+        assert results["gone"].current_p50 is None
+        assert results["added"].status == "new"
+        assert results["added"].baseline_p50 is None
+
+    def test_threshold_exceeded_without_significance_is_ok(self):
+        baseline = make_run({"req": [1.0, 2.0, 3.0]})
+        current = make_run({"req": [1.5, 2.5, 3.5]})
+
+        result = compare_runs(baseline, current, threshold=0.1)[0]
+
+        assert result.p50_change > 0.1
+        assert result.p_value >= 0.05
+        assert result.status == "ok"
+
+    def test_significant_shift_below_threshold_is_ok(self):
+        baseline = make_run({"req": [1.0 + i * 0.001 for i in range(20)]})
+        current = make_run({"req": [1.05 + i * 0.001 for i in range(20)]})
+
+        result = compare_runs(baseline, current, threshold=0.1)[0]
+
+        assert result.p_value < 0.05
+        assert result.p50_change < 0.1
+        assert result.p95_change < 0.1
+        assert result.status == "ok"
+
+    def test_request_with_no_successful_samples_is_missing(self):
+        baseline = make_run({"req": [1.0, 1.1, 1.2]})
+        current = make_run({"req": []})
+
+        assert compare_runs(baseline, current)[0].status == "missing"
+
+    def test_zero_baseline_latency(self):
+        baseline = make_run({"req": [0.0] * 5})
+        current = make_run({"req": [1.0] * 5})
+
+        result = compare_runs(baseline, current)[0]
+
+        assert math.isinf(result.p50_change)
+        assert result.status == "regressed"
+
+class TestBenchRunner:
+    def test_failed_calls_are_excluded(self, server, make_collection):
+        collection = CollectionLoader.load_collection(make_collection([
+            {"name": "Health", "method": "GET", "endpoint": "/api/v1/health"},
+            {"name": "Gone", "method": "GET", "endpoint": "/api/v1/gone"},
+            {"name": "Wrong", "method": "GET", "endpoint": "/api/v1/health",
+             "tests": {"status_code": 201}}
+        ]))
+        runner = BenchRunner(RequestExecutor(server.start_background()))
+
+        run = runner.run(collection, iterations=3, warmup=0)
+
+        assert len(run.samples["Health"]) == 3
+        assert run.failures == {"Health": 0, "Gone": 3, "Wrong": 3}
+        assert run.samples["Gone"] == []
+        assert run.samples["Wrong"] == []
+
+    def test_error_status_is_excluded_when_other_tests_pass(self, server, make_collection):
+        collection = CollectionLoader.load_collection(make_collection([
+            {"name": "Gone", "method": "GET", "endpoint": "/api/v1/gone",
+             "tests": {"contains": ["Not Found"]}},
+            {"name": "Empty", "method": "GET", "endpoint": "/api/v1/gone", "tests": {}}
+        ]))
+        runner = BenchRunner(RequestExecutor(server.start_background()))
+
+        run = runner.run(collection, iterations=3, warmup=0)
+
+        assert run.failures == {"Gone": 3, "Empty": 3}
+        assert run.samples["Gone"] == []
+        assert run.samples["Empty"] == []
+
+    def test_expected_error_status_is_sampled(self, server, make_collection):
+        collection = CollectionLoader.load_collection(make_collection([
+            {"name": "Gone", "method": "GET", "endpoint": "/api/v1/gone",
+             "tests": {"status_code": 404}}
+        ]))
+        runner = BenchRunner(RequestExecutor(server.start_background()))
+
+        run = runner.run(collection, iterations=3, warmup=0)
+
+        assert run.failures == {"Gone": 0}
+        assert len(run.samples["Gone"]) == 3
+
+    def test_connection_errors_are_counted(self, server, make_collection):
+        collection = CollectionLoader.load_collection(make_collection([
+            {"name": "Health", "method": "GET", "endpoint": "/api/v1/health"}
+        ]))
+        base_url = server.start_background()
+        server.stop()
+        runner = BenchRunner(RequestExecutor(base_url))
+
+        run = runner.run(collection, iterations=3, warmup=1)
+
+        assert run.failures == {"Health": 3}
+        assert run.samples["Health"] == []
+
+    def test_timeouts_are_counted(self, make_collection):
+        collection = CollectionLoader.load_collection(make_collection([
+            {"name": "Hang", "method": "GET", "endpoint": "/"}
+        ]))
+        with socket.socket() as listener:
+            # Accepted by the backlog but never answered
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(8)
+            port = listener.getsockname()[1]
+            runner = BenchRunner(RequestExecutor(f"http://127.0.0.1:{port}", timeout=0.2))
+
+            run = runner.run(collection, iterations=2, warmup=0)
+
+        assert run.failures == {"Hang": 2}
+
+    def test_duplicate_names_raise(self, server, make_collection):
+        collection = CollectionLoader.load_collection(make_collection([
+            {"name": "Health", "method": "GET", "endpoint": "/api/v1/health"},
+            {"name": "Health", "method": "GET", "endpoint": "/api/v1/users"}
+        ]))
+        runner = BenchRunner(RequestExecutor(server.start_background()))
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            runner.run(collection, iterations=1)
+
+class TestBenchCli:
+    def bench_run(self, runner, collection_file, mock_config, output, *extra):
+        return runner.invoke(cli, [
+            "bench", "run", collection_file,
+            "--output", output,
+            "--iterations", "10",
+            "--mock-config", mock_config,
+            *extra
+        ])
+
+    def test_run_and_compare_round_trip(self, collection_file, mock_config, tmp_path):
+        runner = CliRunner()
+        baseline = str(tmp_path / "baseline.json")
+
+        result = self.bench_run(runner, collection_file, mock_config, baseline)
+        assert result.exit_code == 0, result.output
+        assert "Failed calls: 0" in result.output
+
+        result = runner.invoke(cli, ["bench", "compare", baseline, baseline])
+        assert result.exit_code == 0, result.output
+        assert "No regressions detected" in result.output
+
+        data = json.loads((tmp_path / "baseline.json").read_text())
+        for entry in data["samples"]["Users"]:
+            entry["response_time"] *= 2
+        slow = tmp_path / "slow.json"
+        slow.write_text(json.dumps(data))
+
+        result = runner.invoke(cli, ["bench", "compare", baseline, str(slow)])
+        assert result.exit_code == 1
+        assert "regressed" in result.output
+        assert "Users" in result.output
+
+    def test_compare_fails_on_missing_request(self, collection_file, mock_config, tmp_path):
+        runner = CliRunner()
+        baseline = str(tmp_path / "baseline.json")
+        partial = str(tmp_path / "partial.json")
+
+        assert self.bench_run(runner, collection_file, mock_config, baseline).exit_code == 0
+        assert self.bench_run(runner, collection_file, mock_config, partial,
+                              "--request-name", "Health").exit_code == 0
+
+        result = runner.invoke(cli, ["bench", "compare", baseline, partial])
+        assert result.exit_code == 1
+        assert "missing" in result.output
+
+    def test_compare_load_error_exits_2(self, tmp_path):
+        result = CliRunner().invoke(cli, [
+            "bench", "compare", str(tmp_path / "nope.json"), str(tmp_path / "nope.json")
+        ])
+        assert result.exit_code == 2
+        assert "Error" in result.output
+
+    @pytest.mark.parametrize("option, value", [
+        ("--iterations", "0"),
+        ("--warmup", "-1"),
+        ("--timeout", "0"),
+    ])
+    def test_run_rejects_invalid_options(self, collection_file, tmp_path, option, value):
+        result = CliRunner().invoke(cli, [
+            "bench", "run", collection_file, "--output", str(tmp_path / "run.json"), option, value
+        ])
+        assert result.exit_code == 2
+        assert "Invalid value" in result.output
+        assert not (tmp_path / "run.json").exists()
+
+    @pytest.mark.parametrize("option, value", [
+        ("--alpha", "0"),
+        ("--alpha", "1"),
+        ("--alpha", "5"),
+        ("--alpha", "-1"),
+        ("--threshold", "-0.1"),
+    ])
+    def test_compare_rejects_invalid_options(self, tmp_path, option, value):
+        run = tmp_path / "run.json"
+        BenchRunner.save_run(make_run({"req": [1.0, 1.1, 1.2]}), str(run))
+
+        result = CliRunner().invoke(cli, ["bench", "compare", str(run), str(run), option, value])
+
+        assert result.exit_code == 2
+        assert "Invalid value" in result.output
@@ -0,0 +1,28 @@
+import pytest
+import requests
+
+class TestBackgroundServer:
+    def test_start_and_stop(self, server):
+        base_url = server.start_background()
+
+        response = requests.get(f"{base_url}/api/v1/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+
+        server.stop()
+        with pytest.raises(requests.ConnectionError):
+            requests.get(f"{base_url}/api/v1/health", timeout=1)
+
+    def test_start_twice_raises(self, server):
+        server.start_background()
+        with pytest.raises(RuntimeError):
+            server.start_background()
+
+    def test_restart_after_stop(self, server):
+        server.start_background()
+        server.stop()
+        base_url = server.start_background()
+        assert requests.get(f"{base_url}/api/v1/health").status_code == 200
+
+    def test_stop_without_start(self, server):
+        server.stop()